@@ -132,10 +132,13 @@ def validate_boolean(option, value):
     raise TypeError("%s must be True or False" % (option,))
 
 
+_BOOLEAN_STRINGS = frozenset(['true', 'false'])
+
+
 def validate_boolean_or_string(option, value):
     """Validates that value is True, False, 'true', or 'false'."""
     if isinstance(value, string_type):
-        if value not in ('true', 'false'):
+        if value not in _BOOLEAN_STRINGS:
             raise ValueError("The value of %s must be "
                              "'true' or 'false'" % (option,))
         return value == 'true'
@@ -238,13 +241,10 @@ def validate_positive_float(option, value):
     """Validates that 'value' is a float, or can be converted to one, and is
        positive.
     """
-    errmsg = "%s must be an integer or float" % (option,)
     try:
         value = float(value)
-    except ValueError:
-        raise ValueError(errmsg)
-    except TypeError:
-        raise TypeError(errmsg)
+    except (ValueError, TypeError) as exc:
+        raise type(exc)("%s must be an integer or float" % (option,))
 
     # float('inf') doesn't work in 2.4 or 2.5 on Windows, so just cap floats at
     # one billion - this is a reasonable approximation for infinity
@@ -546,7 +546,8 @@ def get_validated_options(options, warn=True):
     """
     validated_options = {}
     for opt, value in iteritems(options):
-        lower = opt.lower()
+        # Avoid creating a new string when the name is already lowercase.
+        lower = opt if opt.islower() else opt.lower()
         try:
             validator = URI_VALIDATORS.get(lower, raise_config_error)
             value = validator(opt, value)
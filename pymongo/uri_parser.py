@@ -33,37 +33,22 @@ SCHEME_LEN = len(SCHEME)
 DEFAULT_PORT = 27017
 
 
+def _unquote_plus(value):
+    """Wrapper for unquote_plus that skips values with nothing to decode."""
+    # Most URI components have nothing to decode.
+    if '%' not in value and '+' not in value:
+        return value
+    return unquote_plus(value)
+
+
 def _partition(entity, sep):
-    """Python2.4 doesn't have a partition method so we provide
-    our own that mimics str.partition from later releases.
-
-    Split the string at the first occurrence of sep, and return a
-    3-tuple containing the part before the separator, the separator
-    itself, and the part after the separator. If the separator is not
-    found, return a 3-tuple containing the string itself, followed
-    by two empty strings.
-    """
-    parts = entity.split(sep, 1)
-    if len(parts) == 2:
-        return parts[0], sep, parts[1]
-    else:
-        return entity, '', ''
+    """Compatibility wrapper for ``entity.partition(sep)``."""
+    return entity.partition(sep)
 
 
 def _rpartition(entity, sep):
-    """Python2.4 doesn't have an rpartition method so we provide
-    our own that mimics str.rpartition from later releases.
-
-    Split the string at the last occurrence of sep, and return a
-    3-tuple containing the part before the separator, the separator
-    itself, and the part after the separator. If the separator is not
-    found, return a 3-tuple containing two empty strings, followed
-    by the string itself.
-    """
-    idx = entity.rfind(sep)
-    if idx == -1:
-        return '', '', entity
-    return entity[:idx], sep, entity[idx + 1:]
+    """Compatibility wrapper for ``entity.rpartition(sep)``."""
+    return entity.rpartition(sep)
 
 
 def parse_userinfo(userinfo):
@@ -87,11 +72,11 @@ def parse_userinfo(userinfo):
             quote_fn = "urllib.quote_plus"
         raise InvalidURI("Username and password must be escaped according to "
                          "RFC 3986, use %s()." % quote_fn)
-    user, _, passwd = _partition(userinfo, ":")
+    user, _, passwd = userinfo.partition(":")
     # No password is expected with GSSAPI authentication.
     if not user:
         raise InvalidURI("The empty string is not valid username.")
-    return unquote_plus(user), unquote_plus(passwd)
+    return _unquote_plus(user), _unquote_plus(passwd)
 
 
 def parse_ipv6_literal_host(entity, default_port):
@@ -106,11 +91,13 @@ def parse_ipv6_literal_host(entity, default_port):
         - `default_port`: The port number to use when one wasn't
                           specified in entity.
     """
-    if entity.find(']') == -1:
+    i = entity.find(']')
+    if i == -1:
         raise ValueError("an IPv6 address literal must be "
                          "enclosed in '[' and ']' according "
                          "to RFC 2732.")
-    i = entity.find(']:')
+    # Any ']:' must come at or after the first ']'.
+    i = entity.find(']:', i)
     if i == -1:
         return entity[1:-1], default_port
     return entity[1: i], entity[i + 2:]
@@ -134,15 +121,15 @@ def parse_host(entity, default_port=DEFAULT_PORT):
         host, port = parse_ipv6_literal_host(entity, default_port)
     elif entity.endswith(".sock"):
         return entity, default_port
-    elif entity.find(':') != -1:
-        if entity.count(':') > 1:
+    elif ':' in entity:
+        host, _, port = entity.partition(':')
+        if ':' in port:
             raise ValueError("Reserved characters such as ':' must be "
                              "escaped according RFC 2396. An IPv6 "
                              "address literal must be enclosed in '[' "
                              "and ']' according to RFC 2732.")
-        host, port = host.split(':', 1)
     if isinstance(port, string_type):
-        if not port.isdigit() or int(port) > 65535 or int(port) <= 0:
+        if not port.isdigit() or not 0 < int(port) <= 65535:
             raise ValueError("Port must be an integer between 0 and 65535: %s"
                              % (port,))
         port = int(port)
@@ -177,15 +164,17 @@ def _parse_options(opts, delim):
     options = {}
     for opt in opts.split(delim):
         key, val = opt.split("=")
-        if key.lower() == 'readpreferencetags':
+        lower = key if key.islower() else key.lower()
+        if lower == 'readpreferencetags':
             options.setdefault('readpreferencetags', []).append(val)
         else:
             # str(option) to ensure that a unicode URI results in plain 'str'
             # option names. 'normalized' is then suitable to be passed as
             # kwargs in all Python versions.
-            if str(key) in options:
-                warnings.warn("Duplicate URI option %s" % (str(key),))
-            options[str(key)] = unquote_plus(val)
+            key = str(key)
+            if key in options:
+                warnings.warn("Duplicate URI option %s" % (key,))
+            options[key] = _unquote_plus(val)
 
     # Special case for deprecated options
     if "wtimeout" in options:
@@ -301,7 +290,7 @@ def parse_uri(uri, default_port=DEFAULT_PORT, validate=True, warn=False):
     collection = None
     options = {}
 
-    host_part, _, path_part = _partition(scheme_free, '/')
+    host_part, _, path_part = scheme_free.partition('/')
     if not host_part:
         host_part = path_part
         path_part = ""
@@ -311,7 +300,7 @@ def parse_uri(uri, default_port=DEFAULT_PORT, validate=True, warn=False):
                          "the host list and any options.")
 
     if '@' in host_part:
-        userinfo, _, hosts = _rpartition(host_part, '@')
+        userinfo, _, hosts = host_part.rpartition('@')
         user, passwd = parse_userinfo(userinfo)
     else:
         hosts = host_part
@@ -320,14 +309,14 @@ def parse_uri(uri, default_port=DEFAULT_PORT, validate=True, warn=False):
         raise InvalidURI("Any '/' in a unix domain socket must be"
                          " percent-encoded: %s" % host_part)
 
-    hosts = unquote_plus(hosts)
+    hosts = _unquote_plus(hosts)
     nodes = split_hosts(hosts, default_port=default_port)
 
     if path_part:
         if path_part[0] == '?':
-            opts = unquote_plus(path_part[1:])
+            opts = _unquote_plus(path_part[1:])
         else:
-            dbase, _, opts = map(unquote_plus, _partition(path_part, '?'))
+            dbase, _, opts = map(_unquote_plus, path_part.partition('?'))
             if '.' in dbase:
                 dbase, collection = dbase.split('.', 1)
 
@@ -338,9 +327,9 @@ def parse_uri(uri, default_port=DEFAULT_PORT, validate=True, warn=False):
             options = split_options(opts, validate, warn)
 
     if dbase is not None:
-        dbase = unquote_plus(dbase)
+        dbase = _unquote_plus(dbase)
     if collection is not None:
-        collection = unquote_plus(collection)
+        collection = _unquote_plus(collection)
 
     return {
         'nodelist': nodes,